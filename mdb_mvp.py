@@ -5,11 +5,31 @@ Fetches movies from MDB List API and generates a local HTML page
 matching the MDB List website layout.
 """
 
+import functools
+import io
 import os
 import requests
 import json
+import re
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from typing import Dict, List, NamedTuple, Optional
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads  # optional, faster JSON decoding
+except ImportError:
+    from json import loads as _json_loads
+
+
+# KEY=value lines in a .env file (comments and blank lines never match)
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$', re.MULTILINE)
 
 
 def load_env_file():
@@ -17,14 +37,10 @@ def load_env_file():
     env_path = os.path.join(os.path.dirname(__file__), '.env')
     if os.path.exists(env_path):
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key and not os.getenv(key):
-                        os.environ[key] = value
+            text = f.read()
+        for key, value in _ENV_RE.findall(text):
+            if not os.environ.get(key):
+                os.environ[key] = value.strip()
 
 
 # Load .env file
@@ -35,6 +51,207 @@ MDBLIST_API_URL = 'https://api.mdblist.com'
 TMDB_API_KEY = os.getenv('TMDB_API_KEY', '')
 TMDB_BASE_URL = 'https://api.themoviedb.org/3'
 
+# TMDB poster lookups are cached on disk so repeat runs skip the search API
+POSTER_CACHE_PATH = os.path.expanduser('~/.cache/movie-heat/tmdb_posters.json')
+POSTER_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+POSTER_CACHE_TTL_MISS = 6 * 60 * 60  # 6 hours when TMDB had no poster (new releases gain one soon)
+
+# MDB List responses are cached on disk and revalidated with ETag/Last-Modified
+MDB_CACHE_PATH = os.path.expanduser('~/.cache/movie-heat/mdb_responses.json')
+MDB_CACHE_TTL = 30 * 60  # served without revalidation for 30 minutes
+
+# Shared session so MDB List / TMDB connections (and TLS handshakes) are reused
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount('https://', _adapter)
+_SESSION.mount('http://', _adapter)
+
+
+def _load_cache(path: str) -> Dict:
+    """Load an on-disk JSON cache, or start empty if missing/corrupt."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path: str, cache: Dict):
+    """Write a JSON cache back to disk."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+_mdb_cache = _load_cache(MDB_CACHE_PATH)
+_mdb_cache_lock = threading.Lock()
+
+
+def _mdb_get(url: str, params: Dict) -> tuple:
+    """
+    GET an MDB List URL through the on-disk response cache.
+    Fresh entries are returned without a request; stale ones are revalidated
+    with If-None-Match/If-Modified-Since and reused on 304.
+    Returns (status_code, data, text) where data is None unless status is 200.
+    """
+    key = url + '?' + urlencode(sorted((k, v) for k, v in params.items() if k != 'apikey'))
+    entry = _mdb_cache.get(key)
+
+    headers = {}
+    if entry:
+        if time.time() - entry['ts'] < MDB_CACHE_TTL:
+            return (200, _json_loads(entry['body']), entry['body'])
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = _SESSION.get(url, params=params, headers=headers, timeout=10)
+
+    if response.status_code == 304 and entry:
+        body = entry['body']
+        entry = {**entry, 'ts': time.time()}
+    elif response.status_code == 200:
+        body = response.text
+        entry = {
+            'body': body,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'ts': time.time(),
+        }
+    else:
+        return (response.status_code, None, response.text)
+
+    data = _json_loads(body)
+    with _mdb_cache_lock:
+        _mdb_cache[key] = entry
+        _save_cache(MDB_CACHE_PATH, _mdb_cache)
+    return (200, data, body)
+
+
+# Any of these holding a value means the movie has at least one rating
+_RATING_FIELDS = frozenset({
+    'imdb', 'imdb_rating', 'tmdb', 'tmdb_rating', 'rt_critics', 'rt_audience',
+    'metacritic', 'letterboxd', 'trakt', 'overall_score', 'score', 'rating',
+})
+
+
+def _try_endpoint(url: str, params: Dict, limit: int, direct: bool = False) -> tuple:
+    """
+    Probe a single MDB List endpoint.
+    With direct, the response itself is the movie list (a list, or a dict's 'items').
+    Returns (url, movies) where movies is None if the endpoint gave nothing usable.
+    """
+    movies = None
+    try:
+        print(f"Trying endpoint: {url}")
+        status_code, data, text = _mdb_get(url, params)
+
+        if status_code != 200:
+            print(f"  Status {status_code}: {text[:100]}")
+            return (url, None)
+
+        print(f"Success! Response type: {type(data)}")
+
+        # Handle different response structures
+        if direct:
+            if isinstance(data, list):
+                movies = data
+            elif isinstance(data, dict) and 'items' in data:
+                movies = data['items']
+        elif isinstance(data, list):
+            # If it's a list of lists, get items from first list
+            if data and isinstance(data[0], dict):
+                if 'items' in data[0]:
+                    movies = data[0]['items']
+                elif 'id' in data[0] or 'list_id' in data[0]:
+                    # Got a list, now fetch its items
+                    list_id = data[0].get('id') or data[0].get('list_id')
+                    _, list_data, _ = _mdb_get(
+                        f'{MDBLIST_API_URL}/list/{list_id}',
+                        {'apikey': MDBLIST_API_KEY, 'limit': limit}
+                    )
+                    if list_data is not None:
+                        if 'items' in list_data:
+                            movies = list_data['items']
+                        elif isinstance(list_data, list):
+                            movies = list_data
+                else:
+                    # Might be movies directly
+                    movies = data
+        elif isinstance(data, dict):
+            if 'items' in data:
+                movies = data['items']
+            elif 'results' in data:
+                movies = data['results']
+            elif 'movies' in data:
+                movies = data['movies']
+            elif 'data' in data:
+                movies = data['data']
+    except Exception as e:
+        print(f"  Error: {e}")
+
+    return (url, movies or None)
+
+
+def _probe_endpoints(endpoints: List[tuple], params_base: Dict, limit: int, direct: bool = False) -> List[Dict]:
+    """
+    Probe endpoints concurrently and return movies from the first one that answers
+    with usable data. Queued probes are cancelled, but ones already in flight keep
+    running: the interpreter joins their threads at exit, so a slow endpoint can
+    still hold the process open (and print its output) for its full timeout and retries.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(endpoints))
+    pending = {
+        executor.submit(_try_endpoint, endpoint, {**params_base, **extra_params}, limit, direct)
+        for endpoint, extra_params in endpoints
+    }
+
+    movies = []
+    while pending and not movies:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            endpoint, found = future.result()
+            if found:
+                print(f"Found {len(found)} items at {endpoint}")
+                movies = found
+                break
+
+    executor.shutdown(wait=False, cancel_futures=True)
+    return movies
+
+
+# Primary endpoint patterns to probe: (path, names of the params each one takes)
+_ENDPOINT_TEMPLATES = (
+    # Try getting a list by ID (using a common/public list ID)
+    ('/list/1', ('limit',)),
+    ('/list/popular', ('limit',)),
+    ('/list/latest', ('limit',)),
+    # Try media endpoint
+    ('/media', ('type', 'limit', 'year')),
+    # Try user's lists
+    ('/user/lists', ()),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _current_year() -> int:
+    """Current year, looked up once per run."""
+    return datetime.now().year
+
+
+def _build_endpoints(limit: int) -> List[tuple]:
+    """Fill in _ENDPOINT_TEMPLATES as (url, extra_params) pairs for this call."""
+    values = {'type': 'movie', 'limit': limit, 'year': _current_year()}
+    return [
+        (f'{MDBLIST_API_URL}{path}', {name: values[name] for name in param_names})
+        for path, param_names in _ENDPOINT_TEMPLATES
+    ]
+
 
 def fetch_movies(limit=10) -> List[Dict]:
     """
@@ -48,71 +265,8 @@ def fetch_movies(limit=10) -> List[Dict]:
     # API uses query parameter, not headers
     params_base = {'apikey': MDBLIST_API_KEY}
     
-    movies = []
-    
-    # Try different endpoint patterns
-    endpoints_to_try = [
-        # Try getting a list by ID (using a common/public list ID)
-        (f'{MDBLIST_API_URL}/list/1', {'limit': limit}),
-        (f'{MDBLIST_API_URL}/list/popular', {'limit': limit}),
-        (f'{MDBLIST_API_URL}/list/latest', {'limit': limit}),
-        # Try media endpoint
-        (f'{MDBLIST_API_URL}/media', {'type': 'movie', 'limit': limit, 'year': datetime.now().year}),
-        # Try user's lists
-        (f'{MDBLIST_API_URL}/user/lists', {}),
-    ]
-    
-    for endpoint, extra_params in endpoints_to_try:
-        try:
-            params = {**params_base, **extra_params}
-            print(f"Trying endpoint: {endpoint}")
-            response = requests.get(endpoint, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                print(f"Success! Response type: {type(data)}")
-                
-                # Handle different response structures
-                if isinstance(data, list):
-                    # If it's a list of lists, get items from first list
-                    if data and isinstance(data[0], dict):
-                        if 'items' in data[0]:
-                            movies = data[0]['items']
-                        elif 'id' in data[0] or 'list_id' in data[0]:
-                            # Got a list, now fetch its items
-                            list_id = data[0].get('id') or data[0].get('list_id')
-                            list_response = requests.get(
-                                f'{MDBLIST_API_URL}/list/{list_id}',
-                                params={'apikey': MDBLIST_API_KEY, 'limit': limit},
-                                timeout=10
-                            )
-                            if list_response.status_code == 200:
-                                list_data = list_response.json()
-                                if 'items' in list_data:
-                                    movies = list_data['items']
-                                elif isinstance(list_data, list):
-                                    movies = list_data
-                        else:
-                            # Might be movies directly
-                            movies = data
-                elif isinstance(data, dict):
-                    if 'items' in data:
-                        movies = data['items']
-                    elif 'results' in data:
-                        movies = data['results']
-                    elif 'movies' in data:
-                        movies = data['movies']
-                    elif 'data' in data:
-                        movies = data['data']
-                
-                if movies:
-                    print(f"Found {len(movies)} items")
-                    break
-            else:
-                print(f"  Status {response.status_code}: {response.text[:100]}")
-        except Exception as e:
-            print(f"  Error: {e}")
-            continue
+    # Try different endpoint patterns (all probed at once, first usable answer wins)
+    movies = _probe_endpoints(_build_endpoints(limit), params_base, limit)
 
     # If still no movies, try alternative approaches
     if not movies:
@@ -123,45 +277,15 @@ def fetch_movies(limit=10) -> List[Dict]:
             (f'{MDBLIST_API_URL}/list/1/items', {}),
             (f'{MDBLIST_API_URL}/lists/1', {}),
         ]
-        
-        for endpoint, extra_params in alternative_endpoints:
-            try:
-                params = {**params_base, **extra_params}
-                response = requests.get(endpoint, params=params, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, list):
-                        movies = data
-                    elif isinstance(data, dict) and 'items' in data:
-                        movies = data['items']
-                    if movies:
-                        break
-            except:
-                continue
+        movies = _probe_endpoints(alternative_endpoints, params_base, limit, direct=True)
 
     # Filter to only movies with ratings
-    movies_with_ratings = []
-    for movie in movies:
-        if not isinstance(movie, dict):
-            continue
-            
-        # Check if movie has any ratings
-        has_rating = False
-        rating_fields = ['imdb', 'imdb_rating', 'tmdb', 'tmdb_rating', 'rt_critics', 'rt_audience', 
-                        'metacritic', 'letterboxd', 'trakt', 'overall_score', 'score', 'rating']
-        for field in rating_fields:
-            value = movie.get(field)
-            if value is not None and value != '' and value != 'N/A':
-                has_rating = True
-                break
-        
-        if has_rating:
-            movies_with_ratings.append(movie)
-        
-        if len(movies_with_ratings) >= limit:
-            break
-
-    return movies_with_ratings
+    movies_with_ratings = (
+        movie for movie in movies
+        if isinstance(movie, dict)
+        and any(movie[field] not in (None, '', 'N/A') for field in _RATING_FIELDS & movie.keys())
+    )
+    return list(islice(movies_with_ratings, limit))
 
 
 def get_score_color(score: Optional[float]) -> str:
@@ -178,61 +302,138 @@ def get_score_color(score: Optional[float]) -> str:
         return 'red'
 
 
-def get_poster_url(movie: Dict, title: str, year: str) -> str:
-    """Get poster URL, with fallback to TMDB if missing."""
+_poster_cache = _load_cache(POSTER_CACHE_PATH)
+
+
+def _first_poster_path(results) -> str:
+    """poster_path of the first TMDB result, or ''."""
+    return (results[0].get('poster_path') if results else None) or ''
+
+
+def _tmdb_cached_poster(key: str, path: str, params: Dict, extract) -> str:
+    """
+    Call a TMDB endpoint and extract a poster_path from the JSON (or '' if none).
+    Results are cached per key for POSTER_CACHE_TTL seconds (POSTER_CACHE_TTL_MISS
+    when no poster was found); callers persist the cache with _save_cache().
+    """
+    entry = _poster_cache.get(key)
+    if entry:
+        ttl = POSTER_CACHE_TTL if entry['poster_path'] else POSTER_CACHE_TTL_MISS
+        if time.time() - entry['ts'] < ttl:
+            return entry['poster_path']
+
+    try:
+        params = {'api_key': TMDB_API_KEY, **params}
+        response = _SESSION.get(f'{TMDB_BASE_URL}{path}', params=params, timeout=5)
+        if response.status_code != 200:
+            return ''
+        poster_path = extract(_json_loads(response.content))
+    except Exception:
+        return ''
+
+    _poster_cache[key] = {'poster_path': poster_path, 'ts': time.time()}
+    return poster_path
+
+
+def _tmdb_poster_lookup(title: str, year: str) -> str:
+    """Search TMDB by title and year for a movie's poster_path."""
+    return _tmdb_cached_poster(
+        f'{title}|{year}',
+        '/search/movie',
+        {'query': title, 'year': year, 'language': 'en-US'},
+        lambda data: _first_poster_path(data.get('results'))
+    )
+
+
+def _tmdb_find_by_imdb(imdb_id: str) -> str:
+    """Look up a movie's poster_path on TMDB by IMDb ID (exact match, no search)."""
+    return _tmdb_cached_poster(
+        f'imdb:{imdb_id}',
+        f'/find/{imdb_id}',
+        {'external_source': 'imdb_id'},
+        lambda data: _first_poster_path(data.get('movie_results'))
+    )
+
+
+def _resolve_poster_path(movie: Dict) -> str:
+    """Find a poster via /find when the movie has an IMDb ID, else (or if that fails) /search."""
+    imdb_id = movie.get('imdb_id') or movie.get('imdbId')
+    poster_path = _tmdb_find_by_imdb(imdb_id) if imdb_id else ''
+    return poster_path or _tmdb_poster_lookup(movie.get('title', 'Unknown'), _movie_year(movie))
+
+
+def _movie_year(movie: Dict) -> str:
+    """Year shown for a movie (same expression the card title uses)."""
+    return movie.get('year') or movie.get('release_date', '')[:4] if movie.get('release_date') else ''
+
+
+def prefetch_posters(movies: List[Dict]):
+    """
+    Resolve all missing posters from TMDB in one concurrent batch
+    (IMDb ID lookups where possible, title search otherwise). Found posters are written back into movie['poster'].
+    """
+    if not TMDB_API_KEY:
+        return
+
+    missing = [
+        movie for movie in movies
+        if not (movie.get('poster') or movie.get('poster_url') or movie.get('poster_path'))
+    ]
+    if not missing:
+        return
+
+    # Movies with the same lookup key (repeats, re-renders) share a single request
+    groups = {}
+    for movie in missing:
+        key = (movie.get('imdb_id') or movie.get('imdbId'), movie.get('title', 'Unknown'), _movie_year(movie))
+        groups.setdefault(key, []).append(movie)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        poster_paths = executor.map(_resolve_poster_path, [group[0] for group in groups.values()])
+        for group, poster_path in zip(groups.values(), poster_paths):
+            if poster_path:
+                for movie in group:
+                    movie['poster'] = f'https://image.tmdb.org/t/p/w500{poster_path}'
+
+    _save_cache(POSTER_CACHE_PATH, _poster_cache)
+
+
+def get_poster_url(movie: Dict) -> str:
+    """Get poster URL (missing ones are filled in beforehand by prefetch_posters)."""
     poster_url = movie.get('poster') or movie.get('poster_url') or movie.get('poster_path') or ''
-    
-    # If no poster, try to get from TMDB
-    if not poster_url and TMDB_API_KEY:
-        try:
-            search_url = f'{TMDB_BASE_URL}/search/movie'
-            params = {
-                'api_key': TMDB_API_KEY,
-                'query': title,
-                'year': year,
-                'language': 'en-US'
-            }
-            response = requests.get(search_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('results') and len(data['results']) > 0:
-                    poster_path = data['results'][0].get('poster_path')
-                    if poster_path:
-                        poster_url = f'https://image.tmdb.org/t/p/w500{poster_path}'
-        except:
-            pass
-    
     return poster_url or 'https://via.placeholder.com/120x180?text=No+Poster'
 
 
+_DEFAULT_SOURCE_COLOR = 'color: #5b9bd5;'  # Default blue
+
+# High scores get colored source names (matching MDB List colors): source -> (min score, style)
+_SOURCE_COLOR_TABLE = {
+    'tomato': (60, 'color: #FF4500; text-shadow: 0px 0px 1px #FFD700;'),  # Certified Fresh: orange with gold shadow
+    'popcorn': (80, 'color: #6cbdb4; text-shadow: 0px 0px 1px #FFD700;'),  # High audience score: teal with gold shadow
+    'metacritic': (70, 'color: #ffb74d;'),  # High metacritic: gold-ish
+}
+
+# Sources whose numeric scores are shown with one decimal place
+_FLOAT_SOURCES = frozenset({'imdb', 'tmdb', 'letterboxd', 'roger_ebert'})
+
+
 def get_source_color(source: str, score: Optional[float]) -> str:
     """Get color for source name based on source and score. Default is blue."""
-    if score is None:
-        return 'color: #5b9bd5;'  # Default blue
-    
-    # High scores get colored source names (matching MDB List colors)
-    if source == 'tomato' and score >= 60:  # Certified Fresh
-        return 'color: #FF4500; text-shadow: 0px 0px 1px #FFD700;'  # Orange with gold shadow
-    elif source == 'popcorn' and score >= 80:  # High audience score
-        return 'color: #6cbdb4; text-shadow: 0px 0px 1px #FFD700;'  # Teal/cyan with gold shadow
-    elif source == 'metacritic' and score >= 70:  # High metacritic
-        return 'color: #ffb74d;'  # Gold-ish
-    
-    # Default blue
-    return 'color: #5b9bd5;'
+    highlight = _SOURCE_COLOR_TABLE.get(source)
+    if highlight and score is not None and score >= highlight[0]:
+        return highlight[1]
+    return _DEFAULT_SOURCE_COLOR
 
 
 def format_rating_with_votes(value, votes, source: str, popularity_rank: Optional[int] = None) -> tuple:
     """Format rating value and votes. Returns (formatted_score, vote_count_str, source_color_style, popularity_html)."""
     if value is None or value == '':
-        return ('-', '', 'color: #5b9bd5;', '')
+        return ('-', '', _DEFAULT_SOURCE_COLOR, '')
     
     # Format score (always white)
-    if isinstance(value, (int, float)):
-        if source in ['imdb', 'tmdb', 'letterboxd', 'roger_ebert']:
-            score_str = f"{value:.1f}"
-        else:
-            score_str = f"{int(value)}"
+    is_number = isinstance(value, (int, float))
+    if is_number:
+        score_str = f"{value:.1f}" if source in _FLOAT_SOURCES else f"{int(value)}"
     else:
         score_str = str(value)
     
@@ -245,17 +446,127 @@ def format_rating_with_votes(value, votes, source: str, popularity_rank: Optiona
     vote_str = f"/{votes}/" if votes else ""
     
     # Get source color (only affects source name, not score)
-    source_color_style = get_source_color(source, float(value) if isinstance(value, (int, float)) else None)
+    source_color_style = get_source_color(source, float(value) if is_number else None)
     
     return (score_str, vote_str, source_color_style, popularity_html)
 
 
 
+# Each normalized field and the movie keys it may appear under (first truthy wins)
+FIELD_ALIASES = {
+    'synopsis': ('overview', 'synopsis', 'description'),
+    'overall_score': ('overall_score', 'score', 'rating'),
+    'imdb_score': ('imdb', 'imdb_rating', 'imdbRating'),
+    'imdb_votes': ('imdb_votes', 'imdbVotes', 'imdbvotes'),
+    'imdb_popularity': ('imdb_popularity', 'imdbPopularity', 'imdbpopular'),
+    'trakt_score': ('trakt', 'trakt_rating', 'traktRating'),
+    'trakt_votes': ('trakt_votes', 'traktVotes'),
+    'tmdb_score': ('tmdb', 'tmdb_rating', 'tmdbRating', 'vote_average'),
+    'tmdb_votes': ('tmdb_votes', 'tmdbVotes', 'vote_count'),
+    'letterboxd_score': ('letterboxd', 'letterboxd_rating', 'letterboxdRating'),
+    'letterboxd_votes': ('letterboxd_votes', 'letterboxdVotes'),
+    'rt_critics_score': ('rt_critics', 'tomatometer', 'rt_critics_score', 'rtCritics'),
+    'rt_critics_votes': ('rt_critics_votes', 'rtCriticsVotes'),
+    'rt_audience_score': ('rt_audience', 'popcornmeter', 'rt_audience_score', 'rtAudience'),
+    'rt_audience_votes': ('rt_audience_votes', 'rtAudienceVotes'),
+    'metacritic_score': ('metacritic', 'metacritic_score', 'metacriticScore'),
+    'metacritic_votes': ('metacritic_votes', 'metacriticVotes'),
+    'roger_ebert_score': ('roger_ebert', 'ebert', 'rogerEbert'),
+    'age_rating': ('age_rating', 'mpa_rating', 'certification'),
+    'imdb_id': ('imdb_id', 'imdbId', 'imdb'),
+    'tmdb_id': ('tmdb_id', 'tmdbId'),
+}
 
-def generate_html(movies: List[Dict]) -> str:
-    """Generate HTML page matching MDB List layout (Song Sung Blue style)."""
-    
-    html = """<!DOCTYPE html>
+
+# HTML-escapes text in a single C-level pass
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+def first_present(d: Dict, keys: tuple):
+    """Return the first truthy value among keys in d, or None."""
+    for key in keys:
+        value = d.get(key)
+        if value:
+            return value
+    return None
+
+
+class NormalizedMovie(NamedTuple):
+    """Flat, render-ready view of a movie dict (built once per card; title/synopsis are HTML-escaped)."""
+    title: str
+    year: str
+    title_slug: str
+    synopsis: str
+    poster_url: str
+    score_color: str
+    score_display: str
+    age_rating: str
+    imdb_id: Optional[str]
+    tmdb_id: Optional[str]
+    imdb_score: object
+    imdb_votes: object
+    imdb_popularity: object
+    trakt_score: object
+    trakt_votes: object
+    tmdb_score: object
+    tmdb_votes: object
+    letterboxd_score: object
+    letterboxd_votes: object
+    rt_critics_score: object
+    rt_critics_votes: object
+    rt_audience_score: object
+    rt_audience_votes: object
+    metacritic_score: object
+    metacritic_votes: object
+    roger_ebert_score: object
+
+
+def _normalize(movie: Dict) -> NormalizedMovie:
+    """Resolve field aliases, fallbacks and display values for a movie in one pass."""
+    fields = {name: first_present(movie, keys) for name, keys in FIELD_ALIASES.items()}
+
+    title = movie.get('title', 'Unknown')
+
+    # Get overall score
+    overall_score = fields.pop('overall_score')
+    if overall_score is None:
+        # Try to calculate from available ratings
+        scores = []
+        if movie.get('imdb'):
+            scores.append(float(movie.get('imdb', 0)) * 10)
+        elif movie.get('imdb_rating'):
+            scores.append(float(movie.get('imdb_rating', 0)) * 10)
+        if movie.get('tmdb'):
+            scores.append(float(movie.get('tmdb', 0)) * 10)
+        elif movie.get('tmdb_rating'):
+            scores.append(float(movie.get('tmdb_rating', 0)) * 10)
+        if movie.get('rt_critics'):
+            scores.append(float(movie.get('rt_critics', 0)))
+        if movie.get('metacritic'):
+            scores.append(float(movie.get('metacritic', 0)))
+        if scores:
+            overall_score = sum(scores) / len(scores)
+
+    # Truncate synopsis
+    synopsis = fields.pop('synopsis') or 'No synopsis available.'
+    synopsis = synopsis if len(synopsis) <= 120 else f'{synopsis[:117]}…'
+
+    fields['age_rating'] = fields['age_rating'] or ''
+
+    return NormalizedMovie(
+        title=title.translate(_HTML_ESCAPE),
+        year=_movie_year(movie),
+        title_slug=_slugify(title),
+        synopsis=synopsis.translate(_HTML_ESCAPE),
+        poster_url=get_poster_url(movie),
+        score_color=get_score_color(overall_score),
+        score_display=f"{int(overall_score)}" if overall_score else "-",
+        **fields
+    )
+
+
+# Page head, styles and grid opening; constant across calls
+_HTML_HEADER = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -472,191 +783,140 @@ def generate_html(movies: List[Dict]) -> str:
         <h1>Latest Movie Releases</h1>
         <div class="movies-grid">
 """
-    
-    for movie in movies:
-        # Extract movie data
-        title = movie.get('title', 'Unknown')
-        year = movie.get('year') or movie.get('release_date', '')[:4] if movie.get('release_date') else ''
-        synopsis = movie.get('overview') or movie.get('synopsis') or movie.get('description') or 'No synopsis available.'
-        
-        # Get poster URL with fallback
-        poster_url = get_poster_url(movie, title, year)
-        
-        # Get overall score
-        overall_score = movie.get('overall_score') or movie.get('score') or movie.get('rating')
-        if overall_score is None:
-            # Try to calculate from available ratings
-            scores = []
-            if movie.get('imdb'):
-                scores.append(float(movie.get('imdb', 0)) * 10)
-            elif movie.get('imdb_rating'):
-                scores.append(float(movie.get('imdb_rating', 0)) * 10)
-            if movie.get('tmdb'):
-                scores.append(float(movie.get('tmdb', 0)) * 10)
-            elif movie.get('tmdb_rating'):
-                scores.append(float(movie.get('tmdb_rating', 0)) * 10)
-            if movie.get('rt_critics'):
-                scores.append(float(movie.get('rt_critics', 0)))
-            if movie.get('metacritic'):
-                scores.append(float(movie.get('metacritic', 0)))
-            if scores:
-                overall_score = sum(scores) / len(scores)
-        
-        score_color = get_score_color(overall_score)
-        score_display = f"{int(overall_score)}" if overall_score else "-"
-        
-        # Get ratings with votes and popularity
-        imdb_score = movie.get('imdb') or movie.get('imdb_rating') or movie.get('imdbRating')
-        imdb_votes = movie.get('imdb_votes') or movie.get('imdbVotes') or movie.get('imdbvotes')
-        imdb_popularity = movie.get('imdb_popularity') or movie.get('imdbPopularity') or movie.get('imdbpopular')
-        
-        trakt_score = movie.get('trakt') or movie.get('trakt_rating') or movie.get('traktRating')
-        trakt_votes = movie.get('trakt_votes') or movie.get('traktVotes')
-        
-        tmdb_score = movie.get('tmdb') or movie.get('tmdb_rating') or movie.get('tmdbRating') or movie.get('vote_average')
-        tmdb_votes = movie.get('tmdb_votes') or movie.get('tmdbVotes') or movie.get('vote_count')
-        
-        letterboxd_score = movie.get('letterboxd') or movie.get('letterboxd_rating') or movie.get('letterboxdRating')
-        letterboxd_votes = movie.get('letterboxd_votes') or movie.get('letterboxdVotes')
-        
-        rt_critics_score = movie.get('rt_critics') or movie.get('tomatometer') or movie.get('rt_critics_score') or movie.get('rtCritics')
-        rt_critics_votes = movie.get('rt_critics_votes') or movie.get('rtCriticsVotes')
-        
-        rt_audience_score = movie.get('rt_audience') or movie.get('popcornmeter') or movie.get('rt_audience_score') or movie.get('rtAudience')
-        rt_audience_votes = movie.get('rt_audience_votes') or movie.get('rtAudienceVotes')
-        
-        metacritic_score = movie.get('metacritic') or movie.get('metacritic_score') or movie.get('metacriticScore')
-        metacritic_votes = movie.get('metacritic_votes') or movie.get('metacriticVotes')
-        
-        roger_ebert_score = movie.get('roger_ebert') or movie.get('ebert') or movie.get('rogerEbert')
-        
-        # Age rating
-        age_rating = movie.get('age_rating') or movie.get('mpa_rating') or movie.get('certification') or ''
-        
-        # Truncate synopsis
-        if len(synopsis) > 120:
-            synopsis = synopsis[:117] + '...'
-        
-        # Build ratings table
-        ratings_rows = []
-        
-        # IMDb
-        imdb_score_str, imdb_votes_str, imdb_color, imdb_popularity_html = format_rating_with_votes(
-            imdb_score, imdb_votes, 'imdb', imdb_popularity
-        )
-        ratings_rows.append(('IMDb', imdb_score_str, imdb_votes_str, imdb_color, imdb_popularity_html))
-        
-        # Trakt
-        trakt_score_str, trakt_votes_str, trakt_color, _ = format_rating_with_votes(
-            trakt_score, trakt_votes, 'trakt'
-        )
-        ratings_rows.append(('Trakt', trakt_score_str, trakt_votes_str, trakt_color, ''))
-        
-        # TMDb
-        tmdb_score_str, tmdb_votes_str, tmdb_color, _ = format_rating_with_votes(
-            tmdb_score, tmdb_votes, 'tmdb'
-        )
-        ratings_rows.append(('TMDb', tmdb_score_str, tmdb_votes_str, tmdb_color, ''))
-        
-        # Letterboxd
-        letterboxd_score_str, letterboxd_votes_str, letterboxd_color, _ = format_rating_with_votes(
-            letterboxd_score, letterboxd_votes, 'letterboxd'
-        )
-        ratings_rows.append(('Letterboxd', letterboxd_score_str, letterboxd_votes_str, letterboxd_color, ''))
-        
-        # Tomato (Rotten Tomatoes Critics)
-        rt_critics_score_str, rt_critics_votes_str, rt_critics_color, _ = format_rating_with_votes(
-            rt_critics_score, rt_critics_votes, 'tomato'
-        )
-        ratings_rows.append(('Tomato', rt_critics_score_str, rt_critics_votes_str, rt_critics_color, ''))
-        
-        # Popcorn (Rotten Tomatoes Audience)
-        rt_audience_score_str, rt_audience_votes_str, rt_audience_color, _ = format_rating_with_votes(
-            rt_audience_score, rt_audience_votes, 'popcorn'
-        )
-        ratings_rows.append(('Popcorn', rt_audience_score_str, rt_audience_votes_str, rt_audience_color, ''))
-        
-        # Metacritic
-        metacritic_score_str, metacritic_votes_str, metacritic_color, _ = format_rating_with_votes(
-            metacritic_score, metacritic_votes, 'metacritic'
-        )
-        ratings_rows.append(('Metacritic', metacritic_score_str, metacritic_votes_str, metacritic_color, ''))
-        
-        # Roger Ebert
-        roger_ebert_score_str, roger_ebert_votes_str, roger_ebert_color, _ = format_rating_with_votes(
-            roger_ebert_score, None, 'roger_ebert'
-        )
-        ratings_rows.append(('RogerEbert', roger_ebert_score_str, roger_ebert_votes_str, roger_ebert_color, ''))
-        
-        # Build ratings table HTML with links
-        def get_source_url(source: str, movie: Dict) -> str:
-            """Get URL for rating source based on movie data."""
-            imdb_id = movie.get('imdb_id') or movie.get('imdbId') or movie.get('imdb')
-            tmdb_id = movie.get('tmdb_id') or movie.get('tmdbId') or movie.get('tmdb_id')
-            title_slug = title.lower().replace(' ', '-').replace(':', '').replace("'", '').replace('.', '')
-            title_slug = ''.join(c for c in title_slug if c.isalnum() or c == '-')
-            
-            if source == 'IMDb' and imdb_id:
-                return f'https://www.imdb.com/title/{imdb_id}'
-            elif source == 'Trakt':
-                return f'https://trakt.tv/movies/{title_slug}-{year}'
-            elif source == 'TMDb' and tmdb_id:
-                return f'https://www.themoviedb.org/movie/{tmdb_id}'
-            elif source == 'Letterboxd' and imdb_id:
-                return f'https://letterboxd.com/imdb/{imdb_id}'
-            elif source == 'Tomato':
-                return f'https://www.rottentomatoes.com/m/{title_slug}_{year}'
-            elif source == 'Popcorn':
-                return f'https://www.rottentomatoes.com/m/{title_slug}_{year}'
-            elif source == 'Metacritic':
-                return f'https://www.metacritic.com/movie/{title_slug}-{year}'
-            elif source == 'RogerEbert':
-                # Roger Ebert URLs are harder to construct, might need title search
-                return '#'
-            return '#'
-        
-        ratings_table_html = '<table class="ratings-table">'
-        for source, score, votes, source_color_style, popularity_html in ratings_rows:
-            if score != '-' or votes:
-                source_url = get_source_url(source, movie)
-                source_link = f'<a href="{source_url}" target="_blank" style="text-decoration: none; {source_color_style}">{source}</a>' if source_url != '#' else f'<span style="{source_color_style}">{source}</span>'
-                ratings_table_html += f'''
-                <tr>
-                    <td class="rating-source">{source_link}{popularity_html}</td>
-                    <td class="rating-score">{score}</td>
-                    <td class="rating-votes">{votes}</td>
-                </tr>'''
-        ratings_table_html += '</table>'
-        
-        html += f"""
+
+
+_SLUG_TABLE = str.maketrans({' ': '-', ':': None, "'": None, '.': None})
+_SLUG_STRIP_RE = re.compile(r'[^\w-]|_')
+
+
+def _slugify(title: str) -> str:
+    """URL slug for a title: lowercase, spaces to hyphens, only letters/digits/hyphens kept."""
+    return _SLUG_STRIP_RE.sub('', title.lower().translate(_SLUG_TABLE))
+
+
+def _rt_url(m: NormalizedMovie) -> str:
+    return f'https://www.rottentomatoes.com/m/{m.title_slug}_{m.year}'
+
+
+# Link builders per rating source; sources without one (e.g. RogerEbert) link to '#'
+_SOURCE_URL_BUILDERS = {
+    'IMDb': lambda m: f'https://www.imdb.com/title/{m.imdb_id}' if m.imdb_id else '#',
+    'Trakt': lambda m: f'https://trakt.tv/movies/{m.title_slug}-{m.year}',
+    'TMDb': lambda m: f'https://www.themoviedb.org/movie/{m.tmdb_id}' if m.tmdb_id else '#',
+    'Letterboxd': lambda m: f'https://letterboxd.com/imdb/{m.imdb_id}' if m.imdb_id else '#',
+    'Tomato': _rt_url,
+    'Popcorn': _rt_url,
+    'Metacritic': lambda m: f'https://www.metacritic.com/movie/{m.title_slug}-{m.year}',
+}
+
+
+def get_source_url(source: str, m: NormalizedMovie) -> str:
+    """Get URL for rating source based on movie data."""
+    builder = _SOURCE_URL_BUILDERS.get(source)
+    return builder(m) if builder else '#'
+
+
+_HTML_FOOTER = """
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+# Per-movie card markup; filled in with precomputed fields for each movie
+_CARD_TMPL = string.Template("""
             <div class="movie-card">
                 <div class="movie-top-section">
                     <div class="movie-poster-container">
-                        <img src="{poster_url}" alt="{title}" class="movie-poster">
+                        <img src="${poster_url}" alt="${title}" class="movie-poster">
                     </div>
                     <div class="movie-content">
                         <div class="movie-header">
-                            <div class="score-badge {score_color}">{score_display}</div>
+                            <div class="score-badge ${score_color}">${score_display}</div>
                         </div>
-                        {ratings_table_html}
-                        {f'<div class="movie-meta"><span class="age-rating">{age_rating}+</span></div>' if age_rating else ''}
+                        ${ratings_table}
+                        ${age_meta}
                     </div>
                 </div>
                 <div class="movie-title-section">
-                    <div class="movie-title">{title}{f' ({year})' if year else ''}</div>
-                    <div class="movie-synopsis">{synopsis}</div>
+                    <div class="movie-title">${title}${year_suffix}</div>
+                    <div class="movie-synopsis">${synopsis}</div>
                 </div>
             </div>
-"""
-    
-    html += """
-        </div>
-    </div>
-</body>
-</html>
-"""
-    
-    return html
+""")
+
+
+# Ratings table rows in display order:
+# (source label, source key for formatting/colors, NormalizedMovie score field, votes field)
+_RATING_SPEC = (
+    ('IMDb', 'imdb', 'imdb_score', 'imdb_votes'),
+    ('Trakt', 'trakt', 'trakt_score', 'trakt_votes'),
+    ('TMDb', 'tmdb', 'tmdb_score', 'tmdb_votes'),
+    ('Letterboxd', 'letterboxd', 'letterboxd_score', 'letterboxd_votes'),
+    ('Tomato', 'tomato', 'rt_critics_score', 'rt_critics_votes'),  # Rotten Tomatoes Critics
+    ('Popcorn', 'popcorn', 'rt_audience_score', 'rt_audience_votes'),  # Rotten Tomatoes Audience
+    ('Metacritic', 'metacritic', 'metacritic_score', 'metacritic_votes'),
+    ('RogerEbert', 'roger_ebert', 'roger_ebert_score', None),
+)
+
+
+def _render_card(movie: Dict) -> str:
+    """Render one movie card (poster, score badge, ratings table, title)."""
+    m = _normalize(movie)
+
+    # Build ratings table HTML with links
+    table_parts = ['<table class="ratings-table">']
+    for source, source_key, score_field, votes_field in _RATING_SPEC:
+        score, votes, source_color_style, popularity_html = format_rating_with_votes(
+            getattr(m, score_field),
+            getattr(m, votes_field) if votes_field else None,
+            source_key,
+            m.imdb_popularity
+        )
+        if score != '-' or votes:
+            source_url = get_source_url(source, m)
+            source_link = f'<a href="{source_url}" target="_blank" style="text-decoration: none; {source_color_style}">{source}</a>' if source_url != '#' else f'<span style="{source_color_style}">{source}</span>'
+            table_parts.append(f'''
+                <tr>
+                    <td class="rating-source">{source_link}{popularity_html}</td>
+                    <td class="rating-score">{score}</td>
+                    <td class="rating-votes">{votes}</td>
+                </tr>''')
+    table_parts.append('</table>')
+    ratings_table_html = ''.join(table_parts)
+
+    return _CARD_TMPL.substitute(
+        poster_url=m.poster_url,
+        title=m.title,
+        score_color=m.score_color,
+        score_display=m.score_display,
+        ratings_table=ratings_table_html,
+        age_meta=f'<div class="movie-meta"><span class="age-rating">{m.age_rating}+</span></div>' if m.age_rating else '',
+        year_suffix=f' ({m.year})' if m.year else '',
+        synopsis=m.synopsis,
+    )
+
+
+def write_html(movies: List[Dict], fp):
+    """
+    Write the HTML page matching MDB List layout (Song Sung Blue style) to fp.
+    Cards are written one at a time, so fp can be any text file object
+    (e.g. open(...) or gzip.open(..., 'wt')).
+    """
+    # Fill in missing posters up front so the render loop does no network I/O
+    prefetch_posters(movies)
+
+    fp.write(_HTML_HEADER)
+    for movie in movies:
+        fp.write(_render_card(movie))
+    fp.write(_HTML_FOOTER)
+
+
+def generate_html(movies: List[Dict]) -> str:
+    """Generate HTML page matching MDB List layout (Song Sung Blue style)."""
+    buf = io.StringIO()
+    write_html(movies, buf)
+    return buf.getvalue()
 
 
 def get_sample_movies() -> List[Dict]:
@@ -917,11 +1177,9 @@ def main():
     print(f"Found {len(movies)} movies with ratings")
     print("\nGenerating HTML...")
     
-    html_content = generate_html(movies)
-    
     output_file = 'movies_preview.html'
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        write_html(movies, f)
     
     print(f"\nHTML file generated: {output_file}")
     print(f"Open it in your browser to view the results!")
@@ -14,13 +14,31 @@ import os
 import sys
 import json
 import re
+import string
+import functools
+import io
+import sqlite3
+import threading
+import time
 import requests
 import argparse
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from email.message import EmailMessage
+from html import escape
+from html.parser import HTMLParser
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads  # optional, faster JSON decoding
+except ImportError:
+    from json import loads as _json_loads
+
+
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$', re.MULTILINE)
 
 
 def load_env_file():
@@ -28,16 +46,11 @@ def load_env_file():
     env_path = os.path.join(os.path.dirname(__file__), '.env')
     if os.path.exists(env_path):
         with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    # Only set if not already in environment
-                    if key and not os.getenv(key):
-                        os.environ[key] = value
+            text = f.read()
+        # Only set keys not already in the environment (comments never match)
+        for key, value in _ENV_RE.findall(text):
+            if not os.environ.get(key):
+                os.environ[key] = value.strip()
 
 
 # Load .env file first
@@ -50,93 +63,271 @@ OMDB_API_KEY = os.getenv('OMDB_API_KEY', '')
 TMDB_BASE_URL = 'https://api.themoviedb.org/3'
 OMDB_BASE_URL = 'http://www.omdbapi.com/'
 
+# Shared HTTP session: keep-alive reuses one connection per host across all fetches
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+_session = requests.Session()
+# Transient failures (rate limits, 5xx) are retried with backoff, honoring Retry-After
+_retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=frozenset(['GET']), respect_retry_after_header=True)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=_retry)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# On-disk cache of fetcher results (ratings change slowly between runs)
+CACHE_PATH = os.path.expanduser('~/.cache/movie-heat/movie_ratings.sqlite')
+CACHE_TTL = 6 * 60 * 60  # 6 hours
+CACHE_TTL_MISS = 60 * 60  # 1 hour for lookups that found nothing (e.g. not on RT/Letterboxd)
+# Failed lookups (network errors, 5xx, bad payloads) are never cached; see _FetchFailed
+
+_cache_db = None  # sqlite3 connection, opened by enable_cache()
+_cache_lock = threading.Lock()
+
+
+def enable_cache(path: str = CACHE_PATH):
+    """Open (or create) the on-disk result cache used by @cached fetchers."""
+    global _cache_db
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _cache_db = sqlite3.connect(path, check_same_thread=False)
+    _cache_db.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, expires REAL)')
+
+
+def _found_anything(result) -> bool:
+    """True if a fetcher result holds at least one real value."""
+    values = result.values() if isinstance(result, dict) else [result]
+    return any(v not in ('N/A', 'NR', None) for v in values)
+
+
+class _FetchFailed(Exception):
+    """
+    Raised by a @cached fetcher when its request failed, as opposed to the source
+    genuinely having no data. Carries the N/A result to hand back to the caller.
+    """
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+def cached(func):
+    """
+    Cache a fetcher's result on disk, keyed by function name and arguments.
+    Results expire after CACHE_TTL (CACHE_TTL_MISS if nothing was found).
+    Failed fetches (_FetchFailed) return their fallback and are not stored.
+    No-op until enable_cache() is called.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        key = None
+        if _cache_db is not None:
+            key = json.dumps([func.__name__, *args])
+            with _cache_lock:
+                row = _cache_db.execute('SELECT value, expires FROM cache WHERE key = ?', (key,)).fetchone()
+            if row and row[1] > time.time():
+                return json.loads(row[0])
+
+        try:
+            result = func(*args)
+        except _FetchFailed as failed:
+            return failed.result
+
+        if key is not None:
+            ttl = CACHE_TTL if _found_anything(result) else CACHE_TTL_MISS
+            with _cache_lock:
+                _cache_db.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)',
+                                  (key, json.dumps(result), time.time() + ttl))
+                _cache_db.commit()
+        return result
+
+    return wrapper
+
+
+# Scraping patterns, compiled once
+_LB_RATING_RE = re.compile(r'([\d.]+) out of 5')
+_NON_WORD_RE = re.compile(r'[^\w_]')
+_NON_WORD_HYPHEN_RE = re.compile(r'[^\w-]')
+
+# URL slug translation tables (one pass instead of chained .replace calls)
+_RT_SLUG_TABLE = str.maketrans({' ': '_', ':': None, "'": None, '-': '_', '.': None})
+_LB_SLUG_TABLE = str.maketrans({' ': '-', ':': None, "'": None, '.': None})
+
+
+class _RTScoresParser(HTMLParser):
+    """Finds the embedded JSON block holding criticsScore/audienceScore on an RT page."""
+
+    def __init__(self):
+        super().__init__()
+        self.scores = None
+        self._script = None  # text chunks of the JSON <script> being read
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'script' and dict(attrs).get('type') in ('application/json', 'application/ld+json'):
+            self._script = []
+
+    def handle_data(self, data):
+        if self._script is not None:
+            self._script.append(data)
+
+    def handle_endtag(self, tag):
+        if tag != 'script' or self._script is None:
+            return
+        text = ''.join(self._script)
+        self._script = None
+        if self.scores is not None:
+            return
+        try:
+            data = _json_loads(text)
+        except ValueError:
+            return
+        if isinstance(data, dict) and 'audienceScore' in data and 'criticsScore' in data:
+            self.scores = data
+
+
+class _LetterboxdRatingParser(HTMLParser):
+    """Reads the average rating (out of 5) from Letterboxd's twitter:data2 meta tag."""
+
+    def __init__(self):
+        super().__init__()
+        self.rating = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'meta' or self.rating is not None:
+            return
+        attrs = dict(attrs)
+        if attrs.get('name') == 'twitter:data2':
+            match = _LB_RATING_RE.fullmatch(attrs.get('content') or '')
+            if match:
+                self.rating = float(match.group(1))
+
+
+def _scan_page(response, parser: HTMLParser, attr: str):
+    """
+    Feed a streamed page to parser chunk by chunk, stopping as soon as
+    parser.<attr> is set (the targets sit near the top of the page).
+    """
+    if response.encoding is None:
+        response.encoding = 'utf-8'
+    for chunk in response.iter_content(4096, decode_unicode=True):
+        parser.feed(chunk)
+        if getattr(parser, attr) is not None:
+            break
+    return getattr(parser, attr)
+
+
+# Letter grades to percentage using 2025 school grading scale
+_GRADE_MAP = {
+    'A+': '98', 'A': '95', 'A-': '92',
+    'B+': '88', 'B': '85', 'B-': '82',
+    'C+': '78', 'C': '75', 'C-': '72',
+    'D+': '68', 'D': '65', 'D-': '62',
+    'F': '50'
+}
+
+
+def _norm_tenths(value: str) -> str:
+    # Format: "8.5/10", "8.2" or "8.2/10" -> 85 / 82
+    return str(int(float(value.split('/')[0]) * 10))
+
+
+def _norm_pct(value: str) -> str:
+    # Format: "92%" -> 92
+    return value.rstrip('%')
+
+
+def _norm_slash(value: str) -> str:
+    # Format: "73/100" -> 73
+    return value.split('/')[0]
+
+
+def _norm_grade(value: str) -> str:
+    return _GRADE_MAP.get(value.upper(), '-')
+
+
+_NORMALIZERS = {
+    'imdb': _norm_tenths,
+    'tomato': _norm_pct,
+    'popcorn': _norm_pct,
+    'letterboxd': _norm_pct,
+    'metacritic': _norm_slash,
+    'tmdb': _norm_tenths,
+    'cinemascore': _norm_grade,
+}
+
 
 def normalize_score(value: str, score_type: str) -> str:
     """
     Normalize different score formats to 0-100 integer scale.
     Returns string representation of normalized score or '-'.
     """
-    if not value or value == 'N/A' or value == '-':
+    if not value or value in ('N/A', '-'):
         return '-'
 
     try:
-        if score_type == 'imdb':
-            # Format: "8.5/10" -> 85
-            score = float(value.split('/')[0])
-            return str(int(score * 10))
-
-        elif score_type == 'tomato' or score_type == 'popcorn' or score_type == 'letterboxd':
-            # Format: "92%" -> 92
-            return value.rstrip('%')
-
-        elif score_type == 'metacritic':
-            # Format: "73/100" -> 73
-            return value.split('/')[0]
-
-        elif score_type == 'tmdb':
-            # Format: "8.2" or "8.2/10" -> 82
-            if '/' in value:
-                score = float(value.split('/')[0])
-            else:
-                score = float(value)
-            return str(int(score * 10))
-
-        elif score_type == 'cinemascore':
-            # Letter grades to percentage using 2025 school grading scale
-            grade_map = {
-                'A+': '98', 'A': '95', 'A-': '92',
-                'B+': '88', 'B': '85', 'B-': '82',
-                'C+': '78', 'C': '75', 'C-': '72',
-                'D+': '68', 'D': '65', 'D-': '62',
-                'F': '50'
-            }
-            return grade_map.get(value.upper(), '-')
-
-        else:
-            return '-'
-
-    except (ValueError, IndexError, AttributeError):
+        return _NORMALIZERS[score_type](value)
+    except (KeyError, ValueError, IndexError, AttributeError):
         return '-'
 
 
 def check_api_keys():
     """Verify that required API keys are set."""
+    if TMDB_API_KEY and OMDB_API_KEY:
+        return
+
     missing = []
     if not TMDB_API_KEY:
         missing.append('TMDB_API_KEY')
     if not OMDB_API_KEY:
         missing.append('OMDB_API_KEY')
 
-    if missing:
-        print("Error: Missing required API keys:", ', '.join(missing))
-        print("\nTo get free API keys:")
-        print("1. TMDB: https://www.themoviedb.org/settings/api")
-        print("2. OMDb: http://www.omdbapi.com/apikey.aspx")
-        print("\nSet them as environment variables or create a .env file:")
-        print("  export TMDB_API_KEY='your_key_here'")
-        print("  export OMDB_API_KEY='your_key_here'")
-        sys.exit(1)
+    print("Error: Missing required API keys:", ', '.join(missing))
+    print("\nTo get free API keys:")
+    print("1. TMDB: https://www.themoviedb.org/settings/api")
+    print("2. OMDb: http://www.omdbapi.com/apikey.aspx")
+    print("\nSet them as environment variables or create a .env file:")
+    print("  export TMDB_API_KEY='your_key_here'")
+    print("  export OMDB_API_KEY='your_key_here'")
+    sys.exit(1)
+
 
+# get_movie_details' result when TMDB can't be reached (callers get a copy)
+_FALLBACK_DETAILS = {
+    'imdb_id': None,
+    'director': 'N/A', 'writer': 'N/A', 'producer': 'N/A',
+    'actors': 'N/A', 'genres': 'N/A', 'runtime': 'N/A',
+    'mpa_rating': 'NR', 'release_type': 'N/A', 'studio': 'N/A',
+    'overview': 'N/A'
+}
 
+
+@cached
 def get_movie_details(movie_id: int) -> Dict:
     """Fetch detailed movie info from TMDB including credits."""
     try:
-        # Get movie details
+        # Get movie details, with credits and release dates appended (one request)
         details_url = f"{TMDB_BASE_URL}/movie/{movie_id}"
-        credits_url = f"{TMDB_BASE_URL}/movie/{movie_id}/credits"
-        releases_url = f"{TMDB_BASE_URL}/movie/{movie_id}/release_dates"
-
-        params = {'api_key': TMDB_API_KEY, 'language': 'en-US'}
+        params = {'api_key': TMDB_API_KEY, 'language': 'en-US', 'append_to_response': 'credits,release_dates'}
 
-        details = requests.get(details_url, params=params, timeout=10).json()
-        credits = requests.get(credits_url, params=params, timeout=10).json()
-        releases = requests.get(releases_url, params=params, timeout=10).json()
-
-        # Extract crew info
-        crew = credits.get('crew', [])
-        director = next((c['name'] for c in crew if c['job'] == 'Director'), 'N/A')
-        writer = next((c['name'] for c in crew if c['job'] in ['Writer', 'Screenplay']), 'N/A')
-        producer = next((c['name'] for c in crew if c['job'] == 'Producer'), 'N/A')
+        response = _session.get(details_url, params=params, headers=_HEADERS, timeout=10)
+        response.raise_for_status()
+        details = _json_loads(response.content)
+        credits = details.get('credits', {})
+        releases = details.get('release_dates', {})
+
+        # Extract crew info (first Director, Writer/Screenplay and Producer, in one pass)
+        director = writer = producer = 'N/A'
+        for c in credits.get('crew', ()):
+            job = c['job']
+            if job == 'Director' and director == 'N/A':
+                director = c['name']
+            elif job in ('Writer', 'Screenplay') and writer == 'N/A':
+                writer = c['name']
+            elif job == 'Producer' and producer == 'N/A':
+                producer = c['name']
+            else:
+                continue
+            if director != 'N/A' and writer != 'N/A' and producer != 'N/A':
+                break
 
         # Extract top billed actors (1-5 based on availability)
         cast = credits.get('cast', [])[:5]
@@ -148,12 +339,15 @@ def get_movie_details(movie_id: int) -> Dict:
         # Runtime
         runtime = f"{details.get('runtime', 0)} min" if details.get('runtime') else 'N/A'
 
-        # MPA rating
-        us_releases = next((r for r in releases.get('results', []) if r['iso_3166_1'] == 'US'), {})
-        rating = next((r['certification'] for r in us_releases.get('release_dates', []) if r['certification']), 'NR')
-
-        # Release type (wide vs limited)
-        release_type = next((r['type'] for r in us_releases.get('release_dates', []) if r['certification']), 3)
+        # MPA rating and release type (wide vs limited) from the first certified US release
+        rating, release_type = 'NR', 3
+        for r in releases.get('results', ()):
+            if r['iso_3166_1'] == 'US':
+                for rd in r.get('release_dates', ()):
+                    if rd['certification']:
+                        rating, release_type = rd['certification'], rd['type']
+                        break
+                break
         release_label = 'Wide' if release_type >= 3 else 'Limited'
 
         # Studio
@@ -161,6 +355,7 @@ def get_movie_details(movie_id: int) -> Dict:
         studio = studios[0]['name'] if studios else 'N/A'
 
         return {
+            'imdb_id': details.get('imdb_id') or None,
             'director': director,
             'writer': writer,
             'producer': producer,
@@ -172,13 +367,9 @@ def get_movie_details(movie_id: int) -> Dict:
             'studio': studio,
             'overview': details.get('overview', 'N/A')
         }
-    except:
-        return {
-            'director': 'N/A', 'writer': 'N/A', 'producer': 'N/A',
-            'actors': 'N/A', 'genres': 'N/A', 'runtime': 'N/A',
-            'mpa_rating': 'NR', 'release_type': 'N/A', 'studio': 'N/A',
-            'overview': 'N/A'
-        }
+    except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError):
+        # Network errors, bad JSON or an unexpected payload shape: never abort the run
+        raise _FetchFailed(dict(_FALLBACK_DETAILS))
 
 
 def get_latest_releases(limit=15) -> List[Dict]:
@@ -207,9 +398,9 @@ def get_latest_releases(limit=15) -> List[Dict]:
     }
 
     try:
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, headers=_HEADERS, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         movies = []
         for movie in data.get('results', [])[:limit]:
@@ -223,22 +414,27 @@ def get_latest_releases(limit=15) -> List[Dict]:
             })
         return movies
 
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:
         print(f"Error fetching from TMDB: {e}")
         return []
 
 
-def get_omdb_ratings(title: str, year: str) -> Dict[str, Optional[str]]:
+@cached
+def get_omdb_ratings(imdb_id: Optional[str], title: str, year: str) -> Dict[str, Optional[str]]:
     """
     Fetch IMDB and Metacritic ratings from OMDb API.
+    Looks the movie up by IMDb ID when TMDB has one, otherwise by title and year.
     Returns dict with imdb_rating and metacritic.
     """
-    params = {
-        'apikey': OMDB_API_KEY,
-        't': title,
-        'y': year,
-        'type': 'movie'
-    }
+    if imdb_id:
+        params = {'apikey': OMDB_API_KEY, 'i': imdb_id}
+    else:
+        params = {
+            'apikey': OMDB_API_KEY,
+            't': title,
+            'y': year,
+            'type': 'movie'
+        }
 
     result = {
         'imdb_rating': 'N/A',
@@ -246,9 +442,9 @@ def get_omdb_ratings(title: str, year: str) -> Dict[str, Optional[str]]:
     }
 
     try:
-        response = requests.get(OMDB_BASE_URL, params=params, timeout=10)
+        response = _session.get(OMDB_BASE_URL, params=params, headers=_HEADERS, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         if data.get('Response') == 'True':
             # IMDB Rating
@@ -263,10 +459,11 @@ def get_omdb_ratings(title: str, year: str) -> Dict[str, Optional[str]]:
 
         return result
 
-    except requests.RequestException:
-        return result
+    except (requests.RequestException, ValueError):
+        raise _FetchFailed(result)
 
 
+@cached
 def get_rt_scores(title: str, year: str) -> Dict[str, str]:
     """
     Scrape both Tomatometer and Popcornmeter from Rotten Tomatoes website.
@@ -278,9 +475,8 @@ def get_rt_scores(title: str, year: str) -> Dict[str, str]:
     }
 
     # Format title for RT URL (lowercase, replace spaces with underscores)
-    rt_title = title.lower().replace(' ', '_').replace(':', '').replace("'", '').replace('-', '_')
-    # Remove special characters
-    rt_title = re.sub(r'[^\w_]', '', rt_title)
+    # and remove special characters
+    rt_title = _NON_WORD_RE.sub('', title.lower().translate(_RT_SLUG_TABLE))
 
     # Try common URL patterns
     url_patterns = [
@@ -288,58 +484,47 @@ def get_rt_scores(title: str, year: str) -> Dict[str, str]:
         f"https://www.rottentomatoes.com/m/{rt_title}_{year}",
     ]
 
+    failed = False
     for url in url_patterns:
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                continue
-
-            html = response.text
-
-            # Look for embedded JSON with score data
-            json_pattern = r'<script[^>]*type="application/(?:ld\+)?json"[^>]*>(.*?)</script>'
-            matches = re.findall(json_pattern, html, re.DOTALL)
+            with _session.get(url, headers=_HEADERS, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    # 404 just means no page at this URL; anything else is a failed fetch
+                    failed = failed or response.status_code != 404
+                    continue
 
-            for match in matches:
-                try:
-                    data = json.loads(match)
-                    if isinstance(data, dict) and 'audienceScore' in data and 'criticsScore' in data:
-                        # Extract Tomatometer (critics score)
-                        critics = data.get('criticsScore', {})
-                        if 'score' in critics:
-                            result['tomatometer'] = f"{critics['score']}%"
+                # Look for embedded JSON with score data
+                data = _scan_page(response, _RTScoresParser(), 'scores')
 
-                        # Extract Popcornmeter (audience score)
-                        audience = data.get('audienceScore', {})
-                        if 'score' in audience:
-                            result['popcornmeter'] = f"{audience['score']}%"
+            if data:
+                # Extract Tomatometer (critics score)
+                critics = data.get('criticsScore', {})
+                if 'score' in critics:
+                    result['tomatometer'] = f"{critics['score']}%"
 
-                        return result
-                except (json.JSONDecodeError, KeyError):
-                    continue
+                # Extract Popcornmeter (audience score)
+                audience = data.get('audienceScore', {})
+                if 'score' in audience:
+                    result['popcornmeter'] = f"{audience['score']}%"
 
-            # If we got this far and found at least one score, return it
-            if result['tomatometer'] != 'N/A' or result['popcornmeter'] != 'N/A':
                 return result
 
         except requests.RequestException:
-            continue
+            failed = True
 
+    if failed:
+        raise _FetchFailed(result)
     return result
 
 
+@cached
 def get_letterboxd_rating(title: str, year: str) -> str:
     """
     Scrape Letterboxd rating for a movie.
     Returns rating as percentage (0-100) or 'N/A'.
     """
     # Format title for Letterboxd URL (lowercase, hyphens, no special chars)
-    lb_title = title.lower().replace(' ', '-').replace(':', '').replace("'", '').replace('.', '')
-    lb_title = re.sub(r'[^\w-]', '', lb_title)
+    lb_title = _NON_WORD_HYPHEN_RE.sub('', title.lower().translate(_LB_SLUG_TABLE))
 
     # Try common URL patterns
     url_patterns = [
@@ -347,34 +532,32 @@ def get_letterboxd_rating(title: str, year: str) -> str:
         f"https://letterboxd.com/film/{lb_title}-{year}/",
     ]
 
+    failed = False
     for url in url_patterns:
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-
-            if response.status_code != 200:
-                continue
-
-            html = response.text
+            with _session.get(url, headers=_HEADERS, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    # 404 just means no page at this URL; anything else is a failed fetch
+                    failed = failed or response.status_code != 404
+                    continue
 
-            # Look for rating in meta tag
-            rating_pattern = r'<meta name="twitter:data2" content="([\d.]+) out of 5"'
-            match = re.search(rating_pattern, html)
+                # Look for rating in meta tag
+                rating_5 = _scan_page(response, _LetterboxdRatingParser(), 'rating')
 
-            if match:
-                rating_5 = float(match.group(1))
+            if rating_5 is not None:
                 # Convert from 5-star to percentage
                 rating_pct = round((rating_5 / 5.0) * 100)
                 return f"{rating_pct}%"
 
         except requests.RequestException:
-            continue
+            failed = True
 
+    if failed:
+        raise _FetchFailed('N/A')
     return 'N/A'
 
 
+@cached
 def get_cinemascore(title: str, year: str) -> str:
     """
     Fetch CinemaScore from CinemaScore's public API.
@@ -387,11 +570,10 @@ def get_cinemascore(title: str, year: str) -> str:
         search_term = base64.b64encode(title.encode()).decode()
         search_url = f"https://webapp.cinemascore.com/guest/search/title/{search_term}"
 
-        response = requests.get(search_url, timeout=10)
-        if response.status_code != 200:
-            return 'N/A'
+        response = _session.get(search_url, headers=_HEADERS, timeout=10)
+        response.raise_for_status()
 
-        data = response.json()
+        data = _json_loads(response.content)
 
         # Look for a match with the same title and year
         for movie in data:
@@ -415,81 +597,98 @@ def get_cinemascore(title: str, year: str) -> str:
 
         return 'N/A'
 
-    except (requests.RequestException, json.JSONDecodeError, KeyError):
-        return 'N/A'
-
-
-def format_ratings_text(movies: List[Dict], normalize: bool = False) -> str:
-    """Format movie ratings as plain text string."""
-    if not movies:
-        return "No movies to display."
-
-    output = []
-    output.append("\n" + "="*80)
-    output.append("Latest Movie Releases".center(80))
-    output.append("="*80 + "\n")
-
-    for i, movie in enumerate(movies, 1):
-        # Title
-        output.append(f"{movie['title']}")
+    except (requests.RequestException, ValueError, KeyError):
+        raise _FetchFailed('N/A')
 
-        # Written by • Directed by • Produced by
-        output.append(f"Written by: {movie.get('writer', 'N/A')} • Directed by: {movie.get('director', 'N/A')} • Produced by: {movie.get('producer', 'N/A')}")
 
-        # Starring
-        output.append(f"Starring: {movie.get('actors', 'N/A')}")
+# Rating rows shown for each movie: (label, movie field, normalize_score type)
+_RATING_SOURCES = (
+    ('imdb', 'imdb_rating', 'imdb'),
+    ('tomato', 'tomatometer', 'tomato'),
+    ('popcorn', 'popcornmeter', 'popcorn'),
+    ('meta', 'metacritic', 'metacritic'),
+    ('tmdb', 'tmdb_rating', 'tmdb'),
+    ('cinemascore', 'cinemascore', 'cinemascore'),
+    ('boxd', 'letterboxd', 'letterboxd'),
+)
 
-        # Release date
-        release_date = movie.get('release_date', 'N/A')
-        release_type = movie.get('release_type', 'N/A')
-        output.append(f"Release: {release_date} ({release_type})")
 
-        # Genres • Runtime • MPA Rating
-        genres = movie.get('genres', 'N/A')
-        runtime = movie.get('runtime', 'N/A')
-        rating = movie.get('mpa_rating', 'NR')
-        output.append(f"Genres: {genres} • {runtime} • {rating}")
+def _fmt(value, default='-'):
+    """Format a rating for display ('-' when missing)."""
+    v = str(value) if value else default
+    return default if v == 'N/A' else v
 
-        # Studio
-        output.append(f"Studio: {movie.get('studio', 'N/A')}")
-
-        # Logline/Overview
-        overview = movie.get('overview', 'N/A')
-        if len(overview) > 200:
-            overview = overview[:197] + '...'
-        output.append(f"Logline: {overview}")
-
-        # Separator
-        output.append("---")
-
-        # Helper to format ratings
-        def fmt(value, default='-'):
-            v = str(value) if value else default
-            return default if v == 'N/A' else v
-
-        # Ratings
-        output.append(f"imdb: {fmt(movie.get('imdb_rating'))}")
-        output.append(f"tomato: {fmt(movie.get('tomatometer'))}")
-        output.append(f"popcorn: {fmt(movie.get('popcornmeter'))}")
-        output.append(f"meta: {fmt(movie.get('metacritic'))}")
-        output.append(f"tmdb: {fmt(movie.get('tmdb_rating'))}")
-        output.append(f"cinemascore: {fmt(movie.get('cinemascore'))}")
-        output.append(f"boxd: {fmt(movie.get('letterboxd'))}")
 
+def rating_table(movies: List[Dict], normalize: bool = False) -> List[List[tuple]]:
+    """
+    Build the (label, display value) rating pairs for every movie, one source
+    at a time. With normalize, scores are mapped to the 0-100 scale.
+    """
+    table = [[] for _ in movies]
+    for label, field, score_type in _RATING_SOURCES:
+        for row, movie in zip(table, movies):
+            value = movie.get(field)
+            if normalize:
+                value = normalize_score(str(value) if value else value, score_type)
+            row.append((label, _fmt(value)))
+    return table
+
+
+_SEP = "=" * 80
+_TEXT_HEADER = f"\n{_SEP}\n{'Latest Movie Releases'.center(80)}\n{_SEP}\n\n"
+_TEXT_MOVIE_SEP = f"\n\n{_SEP}\n\n"
+
+_TEXT_MOVIE_TMPL = string.Template("""${title}
+Written by: ${writer} • Directed by: ${director} • Produced by: ${producer}
+Starring: ${actors}
+Release: ${release_date} (${release_type})
+Genres: ${genres} • ${runtime} • ${mpa_rating}
+Studio: ${studio}
+Logline: ${overview}
+---
+${ratings}""")
+
+# Movie fields shown by both formatters, with their defaults
+_DISPLAY_FIELDS = (
+    ('writer', 'N/A'), ('director', 'N/A'), ('producer', 'N/A'), ('actors', 'N/A'),
+    ('release_date', 'N/A'), ('release_type', 'N/A'), ('genres', 'N/A'),
+    ('runtime', 'N/A'), ('mpa_rating', 'NR'), ('studio', 'N/A'),
+)
+
+
+def _display_fields(movie: Dict) -> Dict[str, str]:
+    """Movie fields for the output templates, with defaults and the logline truncated."""
+    fields = {key: str(movie.get(key, default)) for key, default in _DISPLAY_FIELDS}
+    fields['title'] = movie['title']
+    overview = movie.get('overview', 'N/A')
+    if len(overview) > 200:
+        overview = overview[:197] + '...'
+    fields['overview'] = overview
+    return fields
+
+
+def format_ratings_text(movies: List[Dict], normalize: bool = False, ratings: Optional[List[List[tuple]]] = None) -> str:
+    """Format movie ratings as plain text string."""
+    if not movies:
+        return "No movies to display."
+    if ratings is None:
+        ratings = rating_table(movies, normalize)
+
+    buf = io.StringIO()
+    buf.write(_TEXT_HEADER)
+    for i, (movie, scores) in enumerate(zip(movies, ratings), 1):
+        buf.write(_TEXT_MOVIE_TMPL.substitute(
+            _display_fields(movie),
+            ratings='\n'.join(f"{label}: {value}" for label, value in scores),
+        ))
         # Add spacing between movies
         if i < len(movies):
-            output.append("\n" + "="*80 + "\n")
+            buf.write(_TEXT_MOVIE_SEP)
+    buf.write("\n")
+    return buf.getvalue()
 
-    return "\n".join(output) + "\n"
 
-
-def format_ratings_html(movies: List[Dict], normalize: bool = False) -> str:
-    """Format movie ratings as HTML string."""
-    if not movies:
-        return "<p>No movies to display.</p>"
-
-    html = []
-    html.append("""
+_HTML_HEADER = """
     <html>
     <head>
         <style>
@@ -504,59 +703,50 @@ def format_ratings_html(movies: List[Dict], normalize: bool = False) -> str:
     </head>
     <body>
         <h1>Latest Movie Releases</h1>
-    """)
-
-    for movie in movies:
-        html.append('<div class="movie">')
-        html.append(f'<div class="title">{movie["title"]}</div>')
-        
-        # Movie info
-        html.append(f'<div class="info">Written by: {movie.get("writer", "N/A")} • Directed by: {movie.get("director", "N/A")} • Produced by: {movie.get("producer", "N/A")}</div>')
-        html.append(f'<div class="info">Starring: {movie.get("actors", "N/A")}</div>')
-        
-        release_date = movie.get('release_date', 'N/A')
-        release_type = movie.get('release_type', 'N/A')
-        html.append(f'<div class="info">Release: {release_date} ({release_type})</div>')
-        
-        genres = movie.get('genres', 'N/A')
-        runtime = movie.get('runtime', 'N/A')
-        rating = movie.get('mpa_rating', 'NR')
-        html.append(f'<div class="info">Genres: {genres} • {runtime} • {rating}</div>')
-        html.append(f'<div class="info">Studio: {movie.get("studio", "N/A")}</div>')
-        
-        overview = movie.get('overview', 'N/A')
-        if len(overview) > 200:
-            overview = overview[:197] + '...'
-        html.append(f'<div class="info">Logline: {overview}</div>')
-        
-        # Ratings
-        html.append('<div class="ratings">')
-        
-        def fmt(value, default='-'):
-            v = str(value) if value else default
-            return default if v == 'N/A' else v
-        
-        ratings = [
-            ('imdb', movie.get('imdb_rating')),
-            ('tomato', movie.get('tomatometer')),
-            ('popcorn', movie.get('popcornmeter')),
-            ('meta', movie.get('metacritic')),
-            ('tmdb', movie.get('tmdb_rating')),
-            ('cinemascore', movie.get('cinemascore')),
-            ('boxd', movie.get('letterboxd'))
-        ]
-        
-        for label, value in ratings:
-            html.append(f'<span class="rating"><span class="rating-label">{label}:</span> {fmt(value)}</span>')
-        
-        html.append('</div>')
-        html.append('</div>')
-
-    html.append("</body></html>")
-    return "\n".join(html)
-
-
-def send_email(movies: List[Dict], normalize: bool = False):
+    """
+_HTML_FOOTER = "</body></html>"
+
+_HTML_MOVIE_TMPL = string.Template("""<div class="movie">
+<div class="title">${title}</div>
+<div class="info">Written by: ${writer} • Directed by: ${director} • Produced by: ${producer}</div>
+<div class="info">Starring: ${actors}</div>
+<div class="info">Release: ${release_date} (${release_type})</div>
+<div class="info">Genres: ${genres} • ${runtime} • ${mpa_rating}</div>
+<div class="info">Studio: ${studio}</div>
+<div class="info">Logline: ${overview}</div>
+<div class="ratings">
+${ratings}
+</div>
+</div>""")
+
+_HTML_RATING_TMPL = '<span class="rating"><span class="rating-label">{}:</span> {}</span>'
+
+
+def _esc(value) -> str:
+    """Escape a value for use as HTML text."""
+    return escape(str(value), quote=False)
+
+
+def format_ratings_html(movies: List[Dict], normalize: bool = False, ratings: Optional[List[List[tuple]]] = None) -> str:
+    """Format movie ratings as HTML string."""
+    if not movies:
+        return "<p>No movies to display.</p>"
+    if ratings is None:
+        ratings = rating_table(movies, normalize)
+
+    parts = [_HTML_HEADER]
+    for movie, scores in zip(movies, ratings):
+        fields = {key: _esc(value) for key, value in _display_fields(movie).items()}
+        parts.append(_HTML_MOVIE_TMPL.substitute(
+            fields,
+            ratings='\n'.join(_HTML_RATING_TMPL.format(label, _esc(value)) for label, value in scores),
+        ))
+
+    parts.append(_HTML_FOOTER)
+    return "\n".join(parts)
+
+
+def send_email(movies: List[Dict], normalize: bool = False, ratings: Optional[List[List[tuple]]] = None):
     """Send movie ratings via email using Gmail SMTP."""
     gmail_user = os.getenv('GMAIL_USER', '')
     gmail_password = os.getenv('GMAIL_APP_PASSWORD', '')
@@ -568,20 +758,20 @@ def send_email(movies: List[Dict], normalize: bool = False):
 
     try:
         # Create message
-        msg = MIMEMultipart('alternative')
+        msg = EmailMessage()
         msg['Subject'] = f'Movie Ratings - {datetime.now().strftime("%B %d, %Y")}'
         msg['From'] = gmail_user
         msg['To'] = recipient
 
         # Create plain text and HTML versions
-        text_content = format_ratings_text(movies, normalize)
-        html_content = format_ratings_html(movies, normalize)
+        if ratings is None:
+            ratings = rating_table(movies, normalize)
+        text_content = format_ratings_text(movies, ratings=ratings)
+        html_content = format_ratings_html(movies, ratings=ratings)
 
-        # Attach parts
-        part1 = MIMEText(text_content, 'plain')
-        part2 = MIMEText(html_content, 'html')
-        msg.attach(part1)
-        msg.attach(part2)
+        # Plain text body with an HTML alternative
+        msg.set_content(text_content)
+        msg.add_alternative(html_content, subtype='html')
 
         # Send email
         with smtplib.SMTP('smtp.gmail.com', 587) as server:
@@ -597,12 +787,58 @@ def send_email(movies: List[Dict], normalize: bool = False):
         return False
 
 
-def display_ratings(movies: List[Dict], normalize: bool = False):
+def display_ratings(movies: List[Dict], normalize: bool = False, ratings: Optional[List[List[tuple]]] = None):
     """Display movie ratings in sequential text format."""
-    text = format_ratings_text(movies, normalize)
+    text = format_ratings_text(movies, normalize, ratings)
     print(text)
 
 
+def enrich_movies(movies: List[Dict]):
+    """
+    Add TMDB details and ratings from every source to each movie (in place).
+    All lookups for all movies run concurrently; results are merged as they arrive.
+    OMDb is queried once TMDB details arrive, so it can look up by IMDb ID.
+    """
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = {}
+        for i, movie in enumerate(movies):
+            title, year = movie['title'], movie['year']
+            futures[executor.submit(get_movie_details, movie['id'])] = (i, 'details')
+            futures[executor.submit(get_rt_scores, title, year)] = (i, 'rt')
+            futures[executor.submit(get_cinemascore, title, year)] = (i, 'cinemascore')
+            futures[executor.submit(get_letterboxd_rating, title, year)] = (i, 'letterboxd')
+
+        pending = [5] * len(movies)  # details, omdb, rt, cinemascore, letterboxd
+        finished = 0
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, source = futures.pop(future)
+                movie = movies[i]
+                result = future.result()
+
+                if source == 'details':
+                    # Detailed movie info from TMDB, then OMDb by its IMDb ID
+                    movie.update(result)
+                    futures[executor.submit(get_omdb_ratings, result.get('imdb_id'), movie['title'], movie['year'])] = (i, 'omdb')
+                elif source == 'omdb':
+                    # IMDB and Metacritic from OMDb
+                    movie['imdb_rating'] = result['imdb_rating']
+                    movie['metacritic'] = result['metacritic']
+                elif source == 'rt':
+                    # Tomatometer and Popcornmeter from Rotten Tomatoes
+                    movie['tomatometer'] = result['tomatometer']
+                    movie['popcornmeter'] = result['popcornmeter']
+                else:
+                    # CinemaScore grade / Letterboxd rating
+                    movie[source] = result
+
+                pending[i] -= 1
+                if not pending[i]:
+                    finished += 1
+                    print(f"Processed {finished}/{len(movies)}: {movie['title']} ({movie['year']})")
+
+
 def main():
     """Main execution flow."""
     # Parse command-line arguments
@@ -619,8 +855,16 @@ def main():
         action='store_true',
         help='Send results via email (requires GMAIL_USER, GMAIL_APP_PASSWORD, RECIPIENT_EMAIL env vars)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore the on-disk cache and fetch everything fresh'
+    )
     args = parser.parse_args()
 
+    if not args.no_cache:
+        enable_cache()
+
     print("Movie Ratings Checker")
     print("Fetching latest movie releases...\n")
 
@@ -637,37 +881,15 @@ def main():
     print(f"Found {len(movies)} movies. Fetching ratings...\n")
 
     # Enrich with ratings and details from various sources
-    for i, movie in enumerate(movies):
-        print(f"Processing {i+1}/{len(movies)}: {movie['title']} ({movie['year']})...", end=' ')
-
-        # Get detailed movie info from TMDB
-        details = get_movie_details(movie['id'])
-        movie.update(details)
-
-        # Get IMDB and Metacritic from OMDb
-        omdb_data = get_omdb_ratings(movie['title'], movie['year'])
-        movie['imdb_rating'] = omdb_data['imdb_rating']
-        movie['metacritic'] = omdb_data['metacritic']
-
-        # Get Tomatometer and Popcornmeter from Rotten Tomatoes
-        rt_scores = get_rt_scores(movie['title'], movie['year'])
-        movie['tomatometer'] = rt_scores['tomatometer']
-        movie['popcornmeter'] = rt_scores['popcornmeter']
-
-        # Get CinemaScore from CinemaScore API
-        movie['cinemascore'] = get_cinemascore(movie['title'], movie['year'])
-
-        # Get Letterboxd rating
-        movie['letterboxd'] = get_letterboxd_rating(movie['title'], movie['year'])
-
-        print("Done")
+    enrich_movies(movies)
 
-    # Display results
-    display_ratings(movies, normalize=args.normalize)
+    # Display results (rating values are computed once for the display and the email)
+    ratings = rating_table(movies, args.normalize)
+    display_ratings(movies, ratings=ratings)
 
     # Send email if requested
     if args.email:
-        send_email(movies, normalize=args.normalize)
+        send_email(movies, ratings=ratings)
 
 
 if __name__ == '__main__':